@@ -2,10 +2,17 @@
 PyTorch Image Detection Model Package
 """
 
-from model_handler import ImageDetectionModel
-from detect import detect_image
-
 __all__ = ['ImageDetectionModel', 'detect_image']
 __version__ = '1.0.0'
 
 
+def __getattr__(name):
+    # Defer importing torch/torchvision until the public API is first used (PEP 562)
+    if name == 'ImageDetectionModel':
+        from .model_handler import ImageDetectionModel
+        return ImageDetectionModel
+    if name == 'detect_image':
+        from .detect import detect_image
+        return detect_image
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
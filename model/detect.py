@@ -7,7 +7,11 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from model_handler import ImageDetectionModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def detect_image(image_path: str, confidence: float = 0.5, output: str = None):
@@ -24,9 +28,17 @@ def detect_image(image_path: str, confidence: float = 0.5, output: str = None):
         print(f"Error: Image file not found: {image_path}", file=sys.stderr)
         sys.exit(1)
     
+    # Imported here so the CLI parses arguments without loading torch
+    if __package__:
+        from .model_handler import ImageDetectionModel
+    else:
+        # Run as a script rather than as part of the package
+        from model_handler import ImageDetectionModel
+    
     # Initialize model
     print("Loading detection model...")
-    detector = ImageDetectionModel()
+    # A single detection gains nothing from warming up first
+    detector = ImageDetectionModel(warmup=False)
     
     # Run detection
     print(f"Running detection on: {image_path}")
@@ -41,14 +53,21 @@ def detect_image(image_path: str, confidence: float = 0.5, output: str = None):
     
     # Print results
     print(f"\nFound {len(detections)} detection(s):")
-    for i, det in enumerate(detections, 1):
-        print(f"  {i}. {det['label']} (confidence: {det['score']:.2f})")
-        print(f"     BBox: {det['bbox']}")
+    if detections:
+        sys.stdout.write("\n".join(
+            f"  {i}. {det['label']} (confidence: {det['score']:.2f})\n"
+            f"     BBox: {det['bbox']}"
+            for i, det in enumerate(detections, 1)
+        ) + "\n")
     
     # Save to file if requested
     if output:
-        with open(output, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson:
+            with open(output, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, 'w') as f:
+                json.dump(results, f, indent=2)
         print(f"\nResults saved to: {output}")
     
     return results
@@ -5,14 +5,64 @@ Supports pre-trained object detection models from torchvision.
 
 import torch
 import torchvision.transforms as transforms
+from torchvision.io import ImageReadMode, decode_jpeg, read_file
 from torchvision.models.detection import (
     fasterrcnn_resnet50_fpn,
     FasterRCNN_ResNet50_FPN_Weights
 )
 from PIL import Image
 import numpy as np
-from typing import List, Dict, Tuple, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import hashlib
 import io
+import os
+import threading
+
+
+# Autocast dtypes selectable through the `precision` constructor argument
+_PRECISION_DTYPES = {
+    'fp16': torch.float16,
+    'bf16': torch.bfloat16,
+    'fp32': None,
+}
+
+# Inference backends selectable through the `backend` constructor argument
+_BACKENDS = ('torch', 'onnx', 'tensorrt')
+
+# Most backbone CUDA graphs kept per instance; least recently used ones are released
+_MAX_CUDA_GRAPHS = 8
+
+# Start Of Image marker every JPEG stream begins with
+_JPEG_SOI_MARKER = b'\xff\xd8'
+
+# Output names of the exported ONNX graph, in torchvision's output dict order
+_ONNX_OUTPUT_NAMES = ['boxes', 'labels', 'scores']
+
+# Loaded (model, transform, session) triples shared across instances, keyed by load options.
+# The model is None for the onnx/tensorrt backends, which only keep the session
+_MODEL_CACHE: Dict[Tuple, Tuple[Optional[torch.nn.Module], Callable, object]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+# (cache key, precision) pairs that have been through a warmup
+_WARMED_UP_MODELS = set()
+
+# COCO dataset class names (default for Faster R-CNN)
+_COCO_CLASS_NAMES: Tuple[str, ...] = (
+    '__background__', 'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus',
+    'train', 'truck', 'boat', 'traffic light', 'fire hydrant', 'N/A', 'stop sign',
+    'parking meter', 'bench', 'bird', 'cat', 'dog', 'horse', 'sheep', 'cow',
+    'elephant', 'bear', 'zebra', 'giraffe', 'N/A', 'backpack', 'umbrella', 'N/A', 'N/A',
+    'handbag', 'tie', 'suitcase', 'frisbee', 'skis', 'snowboard', 'sports ball',
+    'kite', 'baseball bat', 'baseball glove', 'skateboard', 'surfboard', 'tennis racket',
+    'bottle', 'N/A', 'wine glass', 'cup', 'fork', 'knife', 'spoon', 'bowl',
+    'banana', 'apple', 'sandwich', 'orange', 'broccoli', 'carrot', 'hot dog', 'pizza',
+    'donut', 'cake', 'chair', 'couch', 'potted plant', 'bed', 'N/A', 'dining table',
+    'N/A', 'N/A', 'toilet', 'N/A', 'tv', 'laptop', 'mouse', 'remote', 'keyboard',
+    'cell phone', 'microwave', 'oven', 'toaster', 'sink', 'refrigerator', 'N/A', 'book',
+    'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 'toothbrush'
+)
 
 
 class ImageDetectionModel:
@@ -21,32 +71,374 @@ class ImageDetectionModel:
     Uses Faster R-CNN with ResNet-50 backbone by default.
     """
     
-    def __init__(self, model_name: str = "fasterrcnn_resnet50_fpn", device: str = None):
+    def __init__(self, model_name: str = "fasterrcnn_resnet50_fpn", device: str = None,
+                 compile_model: bool = False, cuda_graph: bool = False,
+                 precision: str = "fp16", quantize: bool = False,
+                 backend: str = "torch", onnx_path: str = None,
+                 num_classes: int = None, weights_path: str = None,
+                 class_names: List[str] = None, score_thresh: float = 0.05,
+                 max_detections: int = 50, rpn_top_n: int = 200,
+                 min_size: int = 640, max_size: int = 1024, warmup: bool = True):
         """
         Initialize the detection model.
         
         Args:
             model_name: Name of the model to use (default: fasterrcnn_resnet50_fpn)
             device: Device to run inference on ('cuda', 'cpu', or None for auto-detection)
+            compile_model: Compile the backbone + FPN with torch.compile (default: False). Opt-in
+                because Inductor needs a working C++ compiler (and Triton on GPU).
+            cuda_graph: Capture the backbone + FPN in CUDA graphs on GPU (default: False).
+                Only single-image batches are captured, one graph per padded input shape,
+                and at most 8 graphs are kept. Captures use thread-local error checking,
+                so other threads (and other instances sharing the cached model) may keep
+                running eager work meanwhile; captures and replays on one instance are
+                serialized. Takes precedence over compile_model, which already uses
+                CUDA graphs.
+            precision: Autocast precision of the backbone + FPN on GPU: 'fp16', 'bf16' or
+                'fp32' to disable (default: fp16). The heads and box decoding always run
+                in fp32. Ignored on CPU.
+            quantize: Apply INT8 dynamic quantization to the Linear layers on CPU
+                (default: False). Ignored on GPU.
+            backend: Inference backend: 'torch', 'onnx' (ONNX Runtime) or 'tensorrt'
+                (ONNX Runtime's TensorRT execution provider) (default: torch)
+            onnx_path: ONNX file used by the onnx/tensorrt backends; exported from the
+                torch model if missing. The default, <model_name>-<hash>.onnx in the
+                current directory, hashes the model options so each configuration gets
+                its own export. An explicit path is reused as is, whatever the options.
+            num_classes: Replace the 91-class COCO box predictor with one for this many
+                classes, including background. Requires weights_path (default: None)
+            weights_path: State dict of fine-tuned weights to load instead of the COCO
+                weights, which are then not downloaded (default: None)
+            class_names: Class names indexed by label id, one per class including
+                background; required with num_classes (default: COCO class names)
+            score_thresh: Scores below this are dropped before per-class NMS. Keep it
+                at or below the confidence thresholds passed to detect() (default: 0.05)
+            max_detections: Maximum detections kept per image (default: 50)
+            rpn_top_n: RPN proposals kept after NMS at inference, which bounds the
+                ROI align and box head work (default: 200, torchvision uses 1000)
+            min_size: Shorter side images are resized to before the backbone
+                (default: 640, torchvision uses 800)
+            max_size: Upper bound on the longer side after resizing
+                (default: 1024, torchvision uses 1333)
+            warmup: Run dummy forward passes at load time so compilation and cuDNN
+                autotuning for 4:3 landscape images don't land on the first detect()
+                call (default: True). Short-lived callers should pass False.
         """
+        if precision not in _PRECISION_DTYPES:
+            raise ValueError(f"Unsupported precision: {precision}")
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        if num_classes is not None and (weights_path is None or class_names is None):
+            raise ValueError("num_classes requires weights_path and class_names")
+        expected_classes = num_classes if num_classes is not None else len(_COCO_CLASS_NAMES)
+        if class_names is not None and len(class_names) != expected_classes:
+            raise ValueError(
+                f"class_names has {len(class_names)} entries, expected {expected_classes}"
+            )
+        
         self.device = device if device else ('cuda' if torch.cuda.is_available() else 'cpu')
         self.model_name = model_name
+        self.compile_model = compile_model
+        self.cuda_graph = cuda_graph and self.device == 'cuda' and backend == 'torch'
+        self.precision = precision
+        self.quantize = quantize
+        self.backend = backend
+        self.num_classes = num_classes
+        self.weights_path = weights_path
+        self.class_names = class_names
+        # Extra keyword arguments for the torchvision model builder
+        self._model_kwargs = {
+            'box_score_thresh': score_thresh,
+            'box_detections_per_img': max_detections,
+            'rpn_post_nms_top_n_test': rpn_top_n,
+            'min_size': min_size,
+            'max_size': max_size,
+        }
+        if not onnx_path:
+            # Everything that changes the exported graph or its weights
+            options = repr((num_classes, weights_path, sorted(self._model_kwargs.items())))
+            digest = hashlib.sha1(options.encode()).hexdigest()[:12]
+            onnx_path = f"{model_name}-{digest}.onnx"
+        self.onnx_path = onnx_path
         self.model = None
         self.transform = None
-        self._load_model()
+        # Used when the model provides no transform; built once instead of per image
+        self._fallback_transform = transforms.Compose([
+            transforms.ToTensor()
+        ])
+        self.session = None
+        self._class_names = None
+        self._copy_stream = torch.cuda.Stream() if self.device == 'cuda' else None
+        # Captured backbone graphs keyed by padded input shape, in LRU order
+        self._graphs = OrderedDict()
+        # Serializes captures and replays, which share static input/output buffers
+        self._graph_lock = threading.Lock()
+        self._cache_key = self._load_model()
+        if warmup:
+            self._warmup()
     
-    def _load_model(self):
-        """Load the pre-trained detection model."""
+    def _load_model(self) -> Tuple:
+        """
+        Load the pre-trained detection model, reusing a cached copy if available.
+        
+        Returns:
+            Cache key of the loaded model
+        """
+        # Compilation and quantization only apply to the eager torch backend
+        eager = self.backend == 'torch'
+        compiled = eager and self.compile_model and not self.cuda_graph and hasattr(torch, 'compile')
+        quantized = eager and self.device == 'cpu' and self.quantize
+        # The TensorRT engine bakes in its precision at build time
+        engine_fp16 = self.backend == 'tensorrt' and self.precision != 'fp32'
+        key = (self.model_name, self.device, self.num_classes, self.weights_path,
+               tuple(sorted(self._model_kwargs.items())),
+               self.backend, self.onnx_path if not eager else None,
+               engine_fp16, quantized, compiled)
+        
+        with _MODEL_CACHE_LOCK:
+            if key not in _MODEL_CACHE:
+                weights = self._get_weights()
+                self.transform = weights.transforms()
+                if eager:
+                    self.model = self._build_model(weights, quantized, compiled)
+                else:
+                    # The torch model is only needed to export, so it is not kept
+                    self.session = self._load_onnx_session(weights, engine_fp16)
+                _MODEL_CACHE[key] = (self.model, self.transform, self.session)
+            else:
+                self.model, self.transform, self.session = _MODEL_CACHE[key]
+        
+        # Resolve class names once instead of on every detect() call
+        if self.class_names is not None:
+            self._class_names = tuple(self.class_names)
+        elif hasattr(self.model, 'get_class_names'):
+            self._class_names = self.model.get_class_names()
+        else:
+            # COCO class names (default for Faster R-CNN)
+            self._class_names = self._get_coco_class_names()
+        
+        return key
+    
+    def _get_weights(self) -> FasterRCNN_ResNet50_FPN_Weights:
+        """Get the pre-trained weights enum, which also provides the input transform."""
         if self.model_name == "fasterrcnn_resnet50_fpn":
-            weights = FasterRCNN_ResNet50_FPN_Weights.DEFAULT
-            self.model = fasterrcnn_resnet50_fpn(weights=weights)
-            self.transform = weights.transforms()
+            return FasterRCNN_ResNet50_FPN_Weights.DEFAULT
+        raise ValueError(f"Unsupported model: {self.model_name}")
+    
+    def _build_model(self, weights: FasterRCNN_ResNet50_FPN_Weights, quantized: bool,
+                     compiled: bool) -> torch.nn.Module:
+        """Build the torch detection model in eval mode on the target device."""
+        if self.weights_path:
+            # Every parameter is overwritten below, so skip downloading the COCO weights.
+            # A narrower head shrinks the class logits, softmax and per-class NMS.
+            num_classes = self.num_classes if self.num_classes is not None else len(_COCO_CLASS_NAMES)
+            model = fasterrcnn_resnet50_fpn(
+                weights=None, weights_backbone=None, num_classes=num_classes,
+                **self._model_kwargs
+            )
+            state_dict = torch.load(self.weights_path, map_location='cpu', weights_only=True)
+            model.load_state_dict(state_dict)
         else:
-            raise ValueError(f"Unsupported model: {self.model_name}")
+            model = fasterrcnn_resnet50_fpn(weights=weights, **self._model_kwargs)
+        
+        model.to(self.device)
+        model.eval()
+        
+        if self.device == 'cuda':
+            # NHWC lets cuDNN pick tensor-core conv kernels directly; benchmark mode
+            # autotunes the best algorithm per input shape
+            model = model.to(memory_format=torch.channels_last)
+            torch.backends.cudnn.benchmark = True
+        
+        if quantized:
+            # Only the box head's fc6/fc7/predictor Linears are quantized; conv layers
+            # need static quantization with calibration data, which we don't ship.
+            # Check with torch.profiler that quantized::linear_dynamic kernels are used.
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        
+        if compiled:
+            # _forward() calls the submodules directly, so compile the backbone + FPN,
+            # which is also the part with the most static shapes. reduce-overhead
+            # relies on CUDA graphs, which are not available on CPU.
+            mode = "reduce-overhead" if self.device == 'cuda' else "default"
+            model.backbone = torch.compile(model.backbone, mode=mode, fullgraph=False)
         
-        self.model.to(self.device)
-        self.model.eval()
         print(f"Model loaded on device: {self.device}")
+        return model
+    
+    def _load_onnx_session(self, weights: FasterRCNN_ResNet50_FPN_Weights, engine_fp16: bool):
+        """
+        Create an ONNX Runtime session, exporting the torch model to ONNX first if needed.
+        
+        Args:
+            weights: Pre-trained weights to build the torch model from for export
+            engine_fp16: Let the TensorRT execution provider build an FP16 engine
+            
+        Returns:
+            onnxruntime.InferenceSession for the exported model
+        """
+        try:
+            import onnxruntime
+        except ImportError:
+            # The CUDA and TensorRT execution providers only ship in the GPU build
+            package = 'onnxruntime-gpu' if self.device == 'cuda' else 'onnxruntime'
+            raise ImportError(
+                f"The '{self.backend}' backend requires onnxruntime: pip install {package}"
+            )
+        
+        if not os.path.exists(self.onnx_path):
+            model = self._build_model(weights, quantized=False, compiled=False)
+            
+            # The TorchScript exporter handles torchvision detection models and dynamic_axes
+            dummy = [torch.rand(3, 800, 800, device=self.device)]
+            dynamic_axes = {'image': {1: 'height', 2: 'width'}}
+            dynamic_axes.update({name: {0: 'num_detections'} for name in _ONNX_OUTPUT_NAMES})
+            torch.onnx.export(
+                model, (dummy,), self.onnx_path,
+                opset_version=17,
+                input_names=['image'],
+                output_names=_ONNX_OUTPUT_NAMES,
+                dynamic_axes=dynamic_axes,
+                dynamo=False
+            )
+            print(f"Exported ONNX model to: {self.onnx_path}")
+        
+        providers = ['CPUExecutionProvider']
+        if self.device == 'cuda':
+            providers.insert(0, 'CUDAExecutionProvider')
+        if self.backend == 'tensorrt':
+            # Run with verbose ORT logging to confirm which layers TensorRT actually runs
+            providers.insert(0, ('TensorrtExecutionProvider', {
+                'trt_fp16_enable': engine_fp16,
+                'trt_engine_cache_enable': True,
+                'trt_engine_cache_path': os.path.dirname(os.path.abspath(self.onnx_path))
+            }))
+        
+        return onnxruntime.InferenceSession(self.onnx_path, providers=providers)
+    
+    def _warmup(self):
+        """
+        Run dummy forward passes so the first real call runs at steady-state latency.
+        
+        The first pass pays torch.compile / CUDA graph capture; on GPU a second pass
+        is run because cuDNN benchmark mode settles on its conv algorithms then.
+        Only the padded shape of a 4:3 landscape image is warmed up; other aspect
+        ratios still pay autotuning (and capture) on their first call.
+        
+        Skipped for a cached model another instance already warmed up at the same
+        precision, except with CUDA graphs, which are captured per instance.
+        """
+        # Autocast state changes the kernels cuDNN tunes and the Dynamo guards
+        warmup_key = (self._cache_key, self.precision)
+        if warmup_key in _WARMED_UP_MODELS and not self.cuda_graph:
+            return
+        
+        dummy = torch.zeros(3, 480, 640, device=self.device)
+        iterations = 2 if self.device == 'cuda' else 1
+        with torch.inference_mode():
+            for _ in range(iterations):
+                self._forward([dummy])
+        _WARMED_UP_MODELS.add(warmup_key)
+    
+    def _autocast(self):
+        """Build the autocast context used around the backbone + FPN."""
+        dtype = _PRECISION_DTYPES[self.precision]
+        if self.device != 'cuda' or dtype is None:
+            return contextlib.nullcontext()
+        return torch.autocast(
+            device_type='cuda',
+            dtype=dtype,
+            # The weight cast cache must be off while capturing CUDA graphs
+            cache_enabled=not self.cuda_graph
+        )
+    
+    def _forward(self, images: List[torch.Tensor]) -> List[Dict]:
+        """
+        Run the model on a list of image tensors already on the target device.
+        
+        The GeneralizedRCNN forward is unrolled so that only the backbone + FPN runs
+        under autocast; the RPN, ROI heads and postprocessing stay in fp32, since box
+        decoding casts boxes to the dtype of the regression outputs. With CUDA graphs
+        enabled the backbone of single-image batches is replayed from a captured
+        graph, while the heads (data-dependent shapes from NMS) stay eager.
+        """
+        if self.session is not None:
+            return self._forward_onnx(images)
+        
+        original_image_sizes = [(img.shape[-2], img.shape[-1]) for img in images]
+        image_list, _ = self.model.transform(images)
+        batch = image_list.tensors
+        if self.device == 'cuda':
+            batch = batch.contiguous(memory_format=torch.channels_last)
+        
+        with self._autocast():
+            if self.cuda_graph and batch.shape[0] == 1:
+                features = self._run_backbone(batch)
+            else:
+                features = self.model.backbone(batch)
+        features = OrderedDict((name, feature.float()) for name, feature in features.items())
+        
+        proposals, _ = self.model.rpn(image_list, features)
+        detections, _ = self.model.roi_heads(features, proposals, image_list.image_sizes)
+        return self.model.transform.postprocess(
+            detections, image_list.image_sizes, original_image_sizes
+        )
+    
+    def _forward_onnx(self, images: List[torch.Tensor]) -> List[Dict]:
+        """Run the ONNX Runtime session, which was exported for one image per call."""
+        predictions = []
+        for img in images:
+            outputs = self.session.run(_ONNX_OUTPUT_NAMES, {'image': img.cpu().numpy()})
+            predictions.append({
+                name: torch.from_numpy(output)
+                for name, output in zip(_ONNX_OUTPUT_NAMES, outputs)
+            })
+        return predictions
+    
+    def _run_backbone(self, batch: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """
+        Replay (capturing on first use) the backbone graph for this input shape.
+        
+        Returns:
+            fp32 copies of the FPN feature maps, safe to use after the lock is released
+        """
+        key = tuple(batch.shape)
+        with self._graph_lock:
+            if key in self._graphs:
+                self._graphs.move_to_end(key)
+            else:
+                if len(self._graphs) >= _MAX_CUDA_GRAPHS:
+                    # Each graph has its own memory pool, freed with the graph
+                    self._graphs.popitem(last=False)
+                
+                static_input = torch.zeros_like(batch)
+                
+                # Warm up on a side stream before capture, as required by torch.cuda.graph
+                side_stream = torch.cuda.Stream()
+                side_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(side_stream):
+                    for _ in range(3):
+                        self.model.backbone(static_input)
+                torch.cuda.current_stream().wait_stream(side_stream)
+                
+                # thread_local only rejects unsafe CUDA calls (cudaMalloc, cuDNN autotuning)
+                # made by this thread; the default "global" mode would also fail eager
+                # forwards running concurrently in other threads
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph, capture_error_mode="thread_local"):
+                    static_output = self.model.backbone(static_input)
+                self._graphs[key] = (graph, static_input, static_output)
+            
+            # Copy into the pre-allocated static buffer instead of recapturing
+            graph, static_input, static_output = self._graphs[key]
+            static_input.copy_(batch)
+            graph.replay()
+            return OrderedDict(
+                (name, feature.to(torch.float32, copy=True))
+                for name, feature in static_output.items()
+            )
     
     def preprocess_image(self, image: Union[str, Image.Image, np.ndarray, bytes]) -> torch.Tensor:
         """
@@ -56,8 +448,29 @@ class ImageDetectionModel:
             image: Image input as file path, PIL Image, numpy array, or bytes
             
         Returns:
-            Preprocessed image tensor
+            Preprocessed image tensor on the model device, ready to use on the
+            current stream
         """
+        img_tensor = self._preprocess_async(image)
+        if self._copy_stream is not None:
+            current_stream = torch.cuda.current_stream()
+            current_stream.wait_stream(self._copy_stream)
+            img_tensor.record_stream(current_stream)
+        return img_tensor
+    
+    def _preprocess_async(self, image: Union[str, Image.Image, np.ndarray, bytes]) -> torch.Tensor:
+        """
+        Preprocess an image, leaving GPU work queued on the copy stream.
+        
+        Callers must wait on self._copy_stream before using the returned tensor.
+        """
+        # Decode JPEG files/bytes straight onto the GPU with nvJPEG
+        if self.device == 'cuda' and self.transform and isinstance(image, (str, bytes)):
+            with torch.cuda.stream(self._copy_stream):
+                img_tensor = self._decode_jpeg_on_device(image)
+                if img_tensor is not None:
+                    return self.transform(img_tensor)
+        
         # Convert various input types to PIL Image
         if isinstance(image, str):
             # File path
@@ -74,17 +487,52 @@ class ImageDetectionModel:
         else:
             raise ValueError(f"Unsupported image type: {type(image)}")
         
+        # Upload uint8 pixels (a quarter of the float bytes) from page-locked memory,
+        # then convert to float on the device. The copy runs on a side stream so it
+        # overlaps decoding of the next image.
+        if self.device == 'cuda' and self.transform:
+            img_tensor = transforms.functional.pil_to_tensor(img).pin_memory()
+            with torch.cuda.stream(self._copy_stream):
+                img_tensor = img_tensor.to(self.device, non_blocking=True)
+                return self.transform(img_tensor)
+        
         # Apply model-specific transforms
         if self.transform:
             img_tensor = self.transform(img)
         else:
             # Fallback transform
-            transform = transforms.Compose([
-                transforms.ToTensor()
-            ])
-            img_tensor = transform(img)
+            img_tensor = self._fallback_transform(img)
         
-        return img_tensor
+        return img_tensor.to(self.device)
+    
+    def _decode_jpeg_on_device(self, image: Union[str, bytes]) -> Optional[torch.Tensor]:
+        """
+        Decode a JPEG file path or bytes into a uint8 RGB tensor on the GPU.
+        
+        Returns:
+            CHW uint8 tensor on the model device, or None if the data is not a JPEG
+            that nvJPEG can decode (left to the PIL path)
+        """
+        # JPEG streams start with the SOI marker 0xFFD8; peek at it before reading
+        # everything. open() raises the same FileNotFoundError as the PIL path.
+        if isinstance(image, str):
+            with open(image, 'rb') as f:
+                marker = f.read(2)
+        else:
+            marker = image[:2]
+        if marker != _JPEG_SOI_MARKER:
+            return None
+        
+        if isinstance(image, str):
+            data = read_file(image)
+        else:
+            data = torch.frombuffer(bytearray(image), dtype=torch.uint8)
+        
+        try:
+            return decode_jpeg(data, mode=ImageReadMode.RGB, device=self.device)
+        except RuntimeError:
+            # e.g. arithmetic-coded, some CMYK or truncated files, which PIL handles
+            return None
     
     def detect(self, image: Union[str, Image.Image, np.ndarray, bytes], 
                confidence_threshold: float = 0.5) -> List[Dict]:
@@ -102,57 +550,114 @@ class ImageDetectionModel:
             - 'label': Class label name
             - 'label_id': Class label ID
         """
-        # Preprocess image
-        img_tensor = self.preprocess_image(image)
+        return self.detect_batch([image], confidence_threshold)[0]
+    
+    def detect_batch(self, images: List[Union[str, Image.Image, np.ndarray, bytes]],
+                     confidence_threshold: float = 0.5) -> List[List[Dict]]:
+        """
+        Run object detection on several images in a single forward pass.
         
-        # Add batch dimension and move to device
-        img_tensor = img_tensor.unsqueeze(0).to(self.device)
+        Images may have different sizes; torchvision detection models accept a
+        list of tensors and batch them internally.
         
-        # Run inference
-        with torch.no_grad():
-            predictions = self.model(img_tensor)
+        Args:
+            images: List of image inputs, each a file path, PIL Image, numpy array, or bytes
+            confidence_threshold: Minimum confidence score for detections (0.0-1.0)
+            
+        Returns:
+            One list of detection dictionaries per input image, in input order
+            (see `detect` for the dictionary format)
+        """
+        class_names = self._class_names
         
-        # Process predictions
-        detections = []
-        pred = predictions[0]  # Get first (and only) batch item
+        results = []
+        for raw in self.detect_batch_raw(images, confidence_threshold):
+            # Convert whole arrays at once rather than element by element
+            boxes = raw['boxes'].tolist()
+            scores = raw['scores'].tolist()
+            labels = raw['labels'].tolist()
+            
+            results.append([
+                {
+                    'bbox': box,
+                    'score': score,
+                    'label': class_names[label],
+                    'label_id': label
+                }
+                for box, score, label in zip(boxes, scores, labels)
+            ])
+        
+        return results
+    
+    def detect_raw(self, image: Union[str, Image.Image, np.ndarray, bytes],
+                   confidence_threshold: float = 0.5) -> Dict[str, np.ndarray]:
+        """
+        Run object detection on an image and return parallel arrays.
+        
+        Cheaper than `detect` for crowded scenes since no per-detection Python
+        objects are created.
+        
+        Args:
+            image: Image input as file path, PIL Image, numpy array, or bytes
+            confidence_threshold: Minimum confidence score for detections (0.0-1.0)
+            
+        Returns:
+            Dictionary of arrays with one row per detection:
+            - 'boxes': (N, 4) [x1, y1, x2, y2] bounding box coordinates
+            - 'scores': (N,) confidence scores
+            - 'labels': (N,) class label IDs
+        """
+        return self.detect_batch_raw([image], confidence_threshold)[0]
+    
+    def detect_batch_raw(self, images: List[Union[str, Image.Image, np.ndarray, bytes]],
+                         confidence_threshold: float = 0.5) -> List[Dict[str, np.ndarray]]:
+        """
+        Run object detection on several images and return parallel arrays per image.
+        
+        Args:
+            images: List of image inputs, each a file path, PIL Image, numpy array, or bytes
+            confidence_threshold: Minimum confidence score for detections (0.0-1.0)
+            
+        Returns:
+            One dictionary of arrays per input image, in input order
+            (see `detect_raw` for the dictionary format)
+        """
+        # GeneralizedRCNNTransform can't batch an empty list
+        if not images:
+            return []
         
-        # Get class names
-        if hasattr(self.model, 'get_class_names'):
-            class_names = self.model.get_class_names()
+        # Preprocess and transfer images in parallel; PIL decode and resize release the GIL
+        if len(images) > 1:
+            max_workers = min(len(images), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                img_tensors = list(executor.map(self._preprocess_async, images))
         else:
-            # COCO class names (default for Faster R-CNN)
-            class_names = self._get_coco_class_names()
+            img_tensors = [self._preprocess_async(image) for image in images]
         
-        boxes = pred['boxes'].cpu().numpy()
-        scores = pred['scores'].cpu().numpy()
-        labels = pred['labels'].cpu().numpy()
+        # Wait for the side-stream work before the forward pass uses the tensors
+        if self._copy_stream is not None:
+            current_stream = torch.cuda.current_stream()
+            current_stream.wait_stream(self._copy_stream)
+            for img_tensor in img_tensors:
+                img_tensor.record_stream(current_stream)
         
-        for box, score, label in zip(boxes, scores, labels):
-            if score >= confidence_threshold:
-                detections.append({
-                    'bbox': box.tolist(),
-                    'score': float(score),
-                    'label': class_names[label],
-                    'label_id': int(label)
-                })
+        # Run inference
+        with torch.inference_mode():
+            predictions = self._forward(img_tensors)
         
-        return detections
+        # Threshold on device so only the surviving detections are copied back
+        results = []
+        for pred in predictions:
+            keep = pred['scores'] >= confidence_threshold
+            results.append({
+                'boxes': pred['boxes'][keep].cpu().numpy(),
+                'scores': pred['scores'][keep].cpu().numpy(),
+                'labels': pred['labels'][keep].cpu().numpy()
+            })
+        
+        return results
     
-    def _get_coco_class_names(self) -> List[str]:
+    @staticmethod
+    def _get_coco_class_names() -> Tuple[str, ...]:
         """Get COCO dataset class names."""
-        return [
-            '__background__', 'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus',
-            'train', 'truck', 'boat', 'traffic light', 'fire hydrant', 'N/A', 'stop sign',
-            'parking meter', 'bench', 'bird', 'cat', 'dog', 'horse', 'sheep', 'cow',
-            'elephant', 'bear', 'zebra', 'giraffe', 'N/A', 'backpack', 'umbrella', 'N/A', 'N/A',
-            'handbag', 'tie', 'suitcase', 'frisbee', 'skis', 'snowboard', 'sports ball',
-            'kite', 'baseball bat', 'baseball glove', 'skateboard', 'surfboard', 'tennis racket',
-            'bottle', 'N/A', 'wine glass', 'cup', 'fork', 'knife', 'spoon', 'bowl',
-            'banana', 'apple', 'sandwich', 'orange', 'broccoli', 'carrot', 'hot dog', 'pizza',
-            'donut', 'cake', 'chair', 'couch', 'potted plant', 'bed', 'N/A', 'dining table',
-            'N/A', 'N/A', 'toilet', 'N/A', 'tv', 'laptop', 'mouse', 'remote', 'keyboard',
-            'cell phone', 'microwave', 'oven', 'toaster', 'sink', 'refrigerator', 'N/A', 'book',
-            'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 'toothbrush'
-        ]
-
-
+        return _COCO_CLASS_NAMES